@@ -19,33 +19,14 @@
 
 from typing import List
 
-import json
-
 import cmd2
 from cmd2 import style, fg, bg
 from cmd2 import CommandSet, with_default_category, with_argparser
 import argparse
 
-import os
 import sys
-from optparse import OptionParser
-
-from pySim.ts_51_011 import EF, DF, EF_SST_map, EF_AD_mode_map
-from pySim.ts_31_102 import EF_UST_map, EF_USIM_ADF_map
-from pySim.ts_31_103 import EF_IST_map, EF_ISIM_ADF_map
-
-from pySim.exceptions import *
-from pySim.commands import SimCardCommands
-from pySim.cards import card_detect, Card
-from pySim.utils import h2b, swap_nibbles, rpad, h2s
-from pySim.utils import dec_st, init_reader, sanitize_pin_adm
-from pySim.card_handler import card_handler
 
-from pySim.filesystem import CardMF, RuntimeState
-from pySim.ts_51_011 import CardProfileSIM, DF_TELECOM, DF_GSM
-from pySim.ts_102_221 import CardProfileUICC
-from pySim.ts_31_102 import ADF_USIM
-from pySim.ts_31_103 import ADF_ISIM
+from pySim.utils import h2b, sanitize_pin_adm
 
 class PysimApp(cmd2.Cmd):
 	CUSTOM_CATEGORY = 'pySim Commands'
@@ -61,6 +42,8 @@ class PysimApp(cmd2.Cmd):
 		self.card.read_aids()
 		self.poutput('AIDs on card: %s' % (self.card._aids))
 		self.numeric_path = False
+		self._prompt_file = None
+		self._prompt_paths = None
 		self.add_settable(cmd2.Settable('numeric_path', bool, 'Print File IDs instead of names',
 						  onchange_cb=self._onchange_numeric_path))
 		self.update_prompt()
@@ -69,7 +52,13 @@ class PysimApp(cmd2.Cmd):
 		self.update_prompt()
 
 	def update_prompt(self):
-		path_list = self.rs.selected_file.fully_qualified_path(not self.numeric_path)
+		# the paths only change if a different file was selected; don't walk
+		# up the tree otherwise (e.g. if just numeric_path was changed)
+		if self.rs.selected_file is not self._prompt_file:
+			self._prompt_paths = self.rs.selected_file.fully_qualified_paths()
+			self._prompt_file = self.rs.selected_file
+		(names, fids) = self._prompt_paths
+		path_list = fids if self.numeric_path else names
 		self.prompt = 'pySIM-shell (%s)> ' % ('/'.join(path_list))
 
 	@cmd2.with_category(CUSTOM_CATEGORY)
@@ -92,14 +81,22 @@ class Iso7816Commands(CommandSet):
 
 	def do_select(self, opts):
 		"""SELECT a File (ADF/DF/EF)"""
-		path = opts.arg_list[0]
+		# allow direct calls with a plain path string, bypassing the cmd2 parser
+		if isinstance(opts, cmd2.Statement):
+			path = opts.arg_list[0]
+		else:
+			path = opts
 		fcp_dec = self._cmd.rs.select(path, self._cmd)
 		self._cmd.update_prompt()
+		# no need to pretty-print the decoded FCP if nobody is going to see it
+		if self._cmd.quiet:
+			return
+		import json
 		self._cmd.poutput(json.dumps(fcp_dec, indent=4))
 
 	def complete_select(self, text, line, begidx, endidx) -> List[str]:
 		"""Command Line tab completion for SELECT"""
-		index_dict = { 1: self._cmd.rs.selected_file.get_selectable_names() }
+		index_dict = { 1: self._cmd.rs.get_selectable_names() }
 		return self._cmd.index_based_complete(text, line, begidx, endidx, index_dict=index_dict)
 
 	verify_chv_parser = argparse.ArgumentParser()
@@ -135,46 +132,41 @@ class UsimCommands(CommandSet):
 
 def parse_options():
 
-	parser = OptionParser(usage="usage: %prog [options]")
+	parser = argparse.ArgumentParser()
 
-	parser.add_option("-d", "--device", dest="device", metavar="DEV",
-			help="Serial Device for SIM access [default: %default]",
+	parser.add_argument("-d", "--device", dest="device", metavar="DEV",
+			help="Serial Device for SIM access [default: %(default)s]",
 			default="/dev/ttyUSB0",
 		)
-	parser.add_option("-b", "--baud", dest="baudrate", type="int", metavar="BAUD",
-			help="Baudrate used for SIM access [default: %default]",
+	parser.add_argument("-b", "--baud", dest="baudrate", type=int, metavar="BAUD",
+			help="Baudrate used for SIM access [default: %(default)s]",
 			default=9600,
 		)
-	parser.add_option("-p", "--pcsc-device", dest="pcsc_dev", type='int', metavar="PCSC",
+	parser.add_argument("-p", "--pcsc-device", dest="pcsc_dev", type=int, metavar="PCSC",
 			help="Which PC/SC reader number for SIM access",
 			default=None,
 		)
-	parser.add_option("--modem-device", dest="modem_dev", metavar="DEV",
+	parser.add_argument("--modem-device", dest="modem_dev", metavar="DEV",
 			help="Serial port of modem for Generic SIM Access (3GPP TS 27.007)",
 			default=None,
 		)
-	parser.add_option("--modem-baud", dest="modem_baud", type="int", metavar="BAUD",
-			help="Baudrate used for modem's port [default: %default]",
+	parser.add_argument("--modem-baud", dest="modem_baud", type=int, metavar="BAUD",
+			help="Baudrate used for modem's port [default: %(default)s]",
 			default=115200,
 		)
-	parser.add_option("--osmocon", dest="osmocon_sock", metavar="PATH",
+	parser.add_argument("--osmocon", dest="osmocon_sock", metavar="PATH",
 			help="Socket path for Calypso (e.g. Motorola C1XX) based reader (via OsmocomBB)",
 			default=None,
 		)
 
-	parser.add_option("-a", "--pin-adm", dest="pin_adm",
+	parser.add_argument("-a", "--pin-adm", dest="pin_adm",
 			help="ADM PIN used for provisioning (overwrites default)",
 		)
-	parser.add_option("-A", "--pin-adm-hex", dest="pin_adm_hex",
+	parser.add_argument("-A", "--pin-adm-hex", dest="pin_adm_hex",
 			help="ADM PIN used for provisioning, as hex string (16 characters long",
 		)
 
-	(options, args) = parser.parse_args()
-
-	if args:
-		parser.error("Extraneous arguments")
-
-	return options
+	return parser.parse_args()
 
 
 
@@ -183,6 +175,19 @@ if __name__ == '__main__':
 	# Parse options
 	opts = parse_options()
 
+	# Only pull in the card / filesystem modules once the options are
+	# known to be valid, so that e.g. '--help' returns quickly
+	from pySim.commands import SimCardCommands
+	from pySim.cards import card_detect
+	from pySim.utils import init_reader
+	from pySim.card_handler import card_handler
+
+	from pySim.filesystem import RuntimeState
+	from pySim.ts_51_011 import DF_TELECOM, DF_GSM
+	from pySim.ts_102_221 import CardProfileUICC
+	from pySim.ts_31_102 import ADF_USIM
+	from pySim.ts_31_103 import ADF_ISIM
+
 	# Init card reader driver
 	sl = init_reader(opts)
 	if (sl == None):
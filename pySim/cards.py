@@ -29,6 +29,12 @@ from pySim.utils import *
 from smartcard.util import toBytes
 from pytlv.TLV import *
 
+# First (known) halves of the U/ISIM AID (RID + application code)
+_adf_aid_prefix_map = {
+	"usim": "a0000000871002",
+	"isim": "a0000000871004",
+}
+
 class Card(object):
 
 	def __init__(self, scc):
@@ -222,16 +228,12 @@ class Card(object):
 	# Select ADF.U/ISIM in the Card using its full AID
 	def select_adf_by_aid(self, adf="usim"):
 		# Check for valid ADF name
-		if adf not in ["usim", "isim"]:
+		aid_prefix = _adf_aid_prefix_map.get(adf)
+		if aid_prefix is None:
 			return None
 
-		# First (known) halves of the U/ISIM AID
-		aid_map = {}
-		aid_map["usim"] = "a0000000871002"
-		aid_map["isim"] = "a0000000871004"
-
 		for aid in self._aids:
-			if aid_map[adf] in aid:
+			if aid.startswith(aid_prefix):
 				(res, sw) = self._scc.select_adf(aid)
 				return sw
 
@@ -322,10 +324,8 @@ class IsimCard(Card):
 		super(IsimCard, self).__init__(ssc)
 
 	def read_pcscf(self):
-		rec_cnt = self._scc.record_count(EF_ISIM_ADF_map['PCSCF'])
 		pcscf_recs = ""
-		for i in range(0, rec_cnt):
-			(res, sw) = self._scc.read_record(EF_ISIM_ADF_map['PCSCF'], i + 1)
+		for (res, sw) in self._scc.read_records(EF_ISIM_ADF_map['PCSCF']):
 			if sw == '9000':
 				content = dec_addr_tlv(res)
 				pcscf_recs += "%s" % (len(content) and content or '\tNot available\n')
@@ -397,10 +397,8 @@ class IsimCard(Card):
 		return sw
 
 	def read_impu(self):
-		rec_cnt = self._scc.record_count(EF_ISIM_ADF_map['IMPU'])
 		impu_recs = ""
-		for i in range(0, rec_cnt):
-			(res, sw) = self._scc.read_record(EF_ISIM_ADF_map['IMPU'], i + 1)
+		for (res, sw) in self._scc.read_records(EF_ISIM_ADF_map['IMPU']):
 			if sw == '9000':
 				# Skip the inital tag value ('80') byte and get length of contents
 				length = int(res[2:4], 16)
@@ -424,10 +422,8 @@ class IsimCard(Card):
 		return sw
 
 	def read_iari(self):
-		rec_cnt = self._scc.record_count(EF_ISIM_ADF_map['UICCIARI'])
 		uiari_recs = ""
-		for i in range(0, rec_cnt):
-			(res, sw) = self._scc.read_record(EF_ISIM_ADF_map['UICCIARI'], i + 1)
+		for (res, sw) in self._scc.read_records(EF_ISIM_ADF_map['UICCIARI']):
 			if sw == '9000':
 				# Skip the inital tag value ('80') byte and get length of contents
 				length = int(res[2:4], 16)
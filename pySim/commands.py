@@ -119,6 +119,12 @@ class SimCardCommands(object):
 			rv.append(data)
 		return rv
 
+	# Send a sequence of pre-built APDUs back to back and return the list
+	# of (data, sw) tuples. The status words are not checked, it is up to
+	# the caller to inspect them
+	def send_apdu_script(self, pdus):
+		return [self._tp.send_apdu(pdu) for pdu in pdus]
+
 	def select_file(self, fid):
 		return self._tp.send_apdu_checksw(self.cla_byte + "a4" + self.sel_ctrl + "02" + fid)
 
@@ -163,6 +169,16 @@ class SimCardCommands(object):
 		pdu = self.cla_byte + 'b2%02x04%02x' % (rec_no, rec_length)
 		return self._tp.send_apdu(pdu)
 
+	# Read all records of a linear fixed / cyclic EF. The EF is selected
+	# only once instead of once per record as with read_record()
+	def read_records(self, ef):
+		r = self.select_path(ef)
+		rec_length = self.__record_len(r)
+		rec_cnt = self.__len(r) // rec_length
+		pdus = [self.cla_byte + 'b2%02x04%02x' % (rec_no, rec_length)
+			for rec_no in range(1, rec_cnt + 1)]
+		return self.send_apdu_script(pdus)
+
 	def update_record(self, ef, rec_no, data, force_len=False, verify=False):
 		r = self.select_path(ef)
 		if not force_len:
@@ -40,6 +40,9 @@ class CardFile(object):
     """
     RESERVED_NAMES = ['..', '.', '/', 'MF']
     RESERVED_FIDS = ['3f00']
+    # incremented whenever a file or application is added anywhere, so that
+    # cached information derived from the file system hierarchy can be invalidated
+    tree_version = 0
 
     def __init__(self, fid=None, sfid=None, name=None, desc=None, parent=None):
         if not isinstance(self, CardADF) and fid == None:
@@ -69,13 +72,29 @@ class CardFile(object):
 
     def fully_qualified_path(self, prefer_name=True):
         """Return fully qualified path to file as list of FID or name strings."""
-        if self.parent != self:
-            ret = self.parent.fully_qualified_path(prefer_name)
-        else:
-            ret = []
-        ret.append(self._path_element(prefer_name))
+        # iterate towards the top. MF has parent == self
+        node = self
+        ret = [node._path_element(prefer_name)]
+        while node.parent and node.parent != node:
+            node = node.parent
+            ret.append(node._path_element(prefer_name))
+        ret.reverse()
         return ret
 
+    def fully_qualified_paths(self):
+        """Return fully qualified path to file as tuple of (list of names, list of FIDs),
+           walking up the hierarchy only once."""
+        node = self
+        names = [node._path_element(True)]
+        fids = [node._path_element(False)]
+        while node.parent and node.parent != node:
+            node = node.parent
+            names.append(node._path_element(True))
+            fids.append(node._path_element(False))
+        names.reverse()
+        fids.reverse()
+        return (names, fids)
+
     def get_mf(self):
         """Return the MF (root) of the file system."""
         if self.parent == None:
@@ -116,9 +135,9 @@ class CardFile(object):
         return sels
 
     def get_selectable_names(self, flags = []):
-        """Return a list of strings for all identifiers that are selectable from the current file."""
+        """Return a tuple of strings for all identifiers that are selectable from the current file."""
         sels = self.get_selectables(flags)
-        return sels.keys()
+        return tuple(sels.keys())
 
     def decode_select_response(self, data_hex):
         """Decode the response to a SELECT command."""
@@ -157,6 +176,7 @@ class CardDF(CardFile):
             raise ValueError("File with given name %s already exists" % (child.name))
         self.children[child.fid] = child
         child.parent = self
+        CardFile.tree_version += 1
 
     def add_files(self, children, ignore_existing=False):
         """Add a list of child (DF/EF) to this DF"""
@@ -218,6 +238,7 @@ class CardMF(CardDF):
             raise ValueError("AID %s already exists" % (app.aid))
         self.applications[app.aid] = app
         app.parent=self
+        CardFile.tree_version += 1
 
     def get_app_names(self):
         """Get list of completions (AID names)"""
@@ -538,6 +559,7 @@ class RuntimeState(object):
         self.card = card
         self.selected_file = self.mf
         self.profile = profile
+        self._selectable_cache = {}
         # add applications + MF-files from profile
         for a in self.profile.applications:
             self.mf.add_application(a)
@@ -561,6 +583,17 @@ class RuntimeState(object):
             node = node.parent
         return None
 
+    def get_selectable_names(self):
+        """Return a tuple of identifiers selectable from the currently selected file.
+           The result is cached per file until the file system hierarchy changes."""
+        f = self.selected_file
+        cached = self._selectable_cache.get(f)
+        if cached and cached[0] == CardFile.tree_version:
+            return cached[1]
+        names = f.get_selectable_names()
+        self._selectable_cache[f] = (CardFile.tree_version, names)
+        return names
+
     def interpret_sw(self, sw):
         """Interpret the given SW relative to the currently selected Application
            or the underlying profile."""
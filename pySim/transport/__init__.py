@@ -75,7 +75,7 @@ class LinkBase(object):
 		# See also:
 		# SW1=9F: 3GPP TS 51.011 9.4.1, Responses to commands which are correctly executed
 		# SW1=61: ISO/IEC 7816-4, Table 5 — General meaning of the interindustry values of SW1-SW2
-		if (sw is not None) and ((sw[0:2] == '9f') or (sw[0:2] == '61')):
+		if (sw is not None) and sw.startswith(('9f', '61')):
 			pdu_gr = pdu[0:2] + 'c00000' + sw[2:4]
 			data, sw = self.send_apdu_raw(pdu_gr)
 
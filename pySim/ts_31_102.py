@@ -21,137 +21,151 @@ Various constants from ETSI TS 131 102
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 #
 
+import sys
+
+from pySim.utils import ServiceNameMap
+
+# USIM Service descriptions, indexed by (Service Number - 1)
+# (interned, as several of them are shared with EF.IST)
+EF_UST_names = tuple(map(sys.intern, (
+	'Local Phone Book',	# 1
+	'Fixed Dialling Numbers (FDN)',	# 2
+	'Extension 2',	# 3
+	'Service Dialling Numbers (SDN)',	# 4
+	'Extension3',	# 5
+	'Barred Dialling Numbers (BDN)',	# 6
+	'Extension4',	# 7
+	'Outgoing Call Information (OCI and OCT)',	# 8
+	'Incoming Call Information (ICI and ICT)',	# 9
+	'Short Message Storage (SMS)',	# 10
+	'Short Message Status Reports (SMSR)',	# 11
+	'Short Message Service Parameters (SMSP)',	# 12
+	'Advice of Charge (AoC)',	# 13
+	'Capability Configuration Parameters 2 (CCP2)',	# 14
+	'Cell Broadcast Message Identifier',	# 15
+	'Cell Broadcast Message Identifier Ranges',	# 16
+	'Group Identifier Level 1',	# 17
+	'Group Identifier Level 2',	# 18
+	'Service Provider Name',	# 19
+	'User controlled PLMN selector with Access Technology',	# 20
+	'MSISDN',	# 21
+	'Image (IMG)',	# 22
+	'Support of Localised Service Areas (SoLSA)',	# 23
+	'Enhanced Multi-Level Precedence and Pre-emption Service',	# 24
+	'Automatic Answer for eMLPP',	# 25
+	'RFU',	# 26
+	'GSM Access',	# 27
+	'Data download via SMS-PP',	# 28
+	'Data download via SMS-CB',	# 29
+	'Call Control by USIM',	# 30
+	'MO-SMS Control by USIM',	# 31
+	'RUN AT COMMAND command',	# 32
+	'shall be set to 1',	# 33
+	'Enabled Services Table',	# 34
+	'APN Control List (ACL)',	# 35
+	'Depersonalisation Control Keys',	# 36
+	'Co-operative Network List',	# 37
+	'GSM security context',	# 38
+	'CPBCCH Information',	# 39
+	'Investigation Scan',	# 40
+	'MexE',	# 41
+	'Operator controlled PLMN selector with Access Technology',	# 42
+	'HPLMN selector with Access Technology',	# 43
+	'Extension 5',	# 44
+	'PLMN Network Name',	# 45
+	'Operator PLMN List',	# 46
+	'Mailbox Dialling Numbers',	# 47
+	'Message Waiting Indication Status',	# 48
+	'Call Forwarding Indication Status',	# 49
+	'Reserved and shall be ignored',	# 50
+	'Service Provider Display Information',	# 51
+	'Multimedia Messaging Service (MMS)',	# 52
+	'Extension 8',	# 53
+	'Call control on GPRS by USIM',	# 54
+	'MMS User Connectivity Parameters',	# 55
+	'Network\'s indication of alerting in the MS (NIA)',	# 56
+	'VGCS Group Identifier List (EFVGCS and EFVGCSS)',	# 57
+	'VBS Group Identifier List (EFVBS and EFVBSS)',	# 58
+	'Pseudonym',	# 59
+	'User Controlled PLMN selector for I-WLAN access',	# 60
+	'Operator Controlled PLMN selector for I-WLAN access',	# 61
+	'User controlled WSID list',	# 62
+	'Operator controlled WSID list',	# 63
+	'VGCS security',	# 64
+	'VBS security',	# 65
+	'WLAN Reauthentication Identity',	# 66
+	'Multimedia Messages Storage',	# 67
+	'Generic Bootstrapping Architecture (GBA)',	# 68
+	'MBMS security',	# 69
+	'Data download via USSD and USSD application mode',	# 70
+	'Equivalent HPLMN',	# 71
+	'Additional TERMINAL PROFILE after UICC activation',	# 72
+	'Equivalent HPLMN Presentation Indication',	# 73
+	'Last RPLMN Selection Indication',	# 74
+	'OMA BCAST Smart Card Profile',	# 75
+	'GBA-based Local Key Establishment Mechanism',	# 76
+	'Terminal Applications',	# 77
+	'Service Provider Name Icon',	# 78
+	'PLMN Network Name Icon',	# 79
+	'Connectivity Parameters for USIM IP connections',	# 80
+	'Home I-WLAN Specific Identifier List',	# 81
+	'I-WLAN Equivalent HPLMN Presentation Indication',	# 82
+	'I-WLAN HPLMN Priority Indication',	# 83
+	'I-WLAN Last Registered PLMN',	# 84
+	'EPS Mobility Management Information',	# 85
+	'Allowed CSG Lists and corresponding indications',	# 86
+	'Call control on EPS PDN connection by USIM',	# 87
+	'HPLMN Direct Access',	# 88
+	'eCall Data',	# 89
+	'Operator CSG Lists and corresponding indications',	# 90
+	'Support for SM-over-IP',	# 91
+	'Support of CSG Display Control',	# 92
+	'Communication Control for IMS by USIM',	# 93
+	'Extended Terminal Applications',	# 94
+	'Support of UICC access to IMS',	# 95
+	'Non-Access Stratum configuration by USIM',	# 96
+	'PWS configuration by USIM',	# 97
+	'RFU',	# 98
+	'URI support by UICC',	# 99
+	'Extended EARFCN support',	# 100
+	'ProSe',	# 101
+	'USAT Application Pairing',	# 102
+	'Media Type support',	# 103
+	'IMS call disconnection cause',	# 104
+	'URI support for MO SHORT MESSAGE CONTROL',	# 105
+	'ePDG configuration Information support',	# 106
+	'ePDG configuration Information configured',	# 107
+	'ACDC support',	# 108
+	'MCPTT',	# 109
+	'ePDG configuration Information for Emergency Service support',	# 110
+	'ePDG configuration Information for Emergency Service configured',	# 111
+	'eCall Data over IMS',	# 112
+	'URI support for SMS-PP DOWNLOAD as defined in 3GPP TS 31.111 [12]',	# 113
+	'From Preferred',	# 114
+	'IMS configuration data',	# 115
+	'TV configuration',	# 116
+	'3GPP PS Data Off',	# 117
+	'3GPP PS Data Off Service List',	# 118
+	'V2X',	# 119
+	'XCAP Configuration Data',	# 120
+	'EARFCN list for MTC/NB-IOT UEs',	# 121
+	'5GS Mobility Management Information',	# 122
+	'5G Security Parameters',	# 123
+	'Subscription identifier privacy support',	# 124
+	'SUCI calculation by the USIM',	# 125
+	'UAC Access Identities support',	# 126
+	'Expect control plane-based Steering of Roaming information during initial registration in VPLMN',	# 127
+	'Call control on PDU Session by USIM',	# 128
+)))
+
+def ef_ust_name(srv):
+	"""Return the description of the given USIM Service Number (1-based)"""
+	if srv < 1:
+		raise IndexError(srv)
+	return EF_UST_names[srv - 1]
+
 # Mapping between USIM Service Number and its description
-EF_UST_map = {
-	1: 'Local Phone Book',
-	2: 'Fixed Dialling Numbers (FDN)',
-	3: 'Extension 2',
-	4: 'Service Dialling Numbers (SDN)',
-	5: 'Extension3',
-	6: 'Barred Dialling Numbers (BDN)',
-	7: 'Extension4',
-	8: 'Outgoing Call Information (OCI and OCT)',
-	9: 'Incoming Call Information (ICI and ICT)',
-	10: 'Short Message Storage (SMS)',
-	11: 'Short Message Status Reports (SMSR)',
-	12: 'Short Message Service Parameters (SMSP)',
-	13: 'Advice of Charge (AoC)',
-	14: 'Capability Configuration Parameters 2 (CCP2)',
-	15: 'Cell Broadcast Message Identifier',
-	16: 'Cell Broadcast Message Identifier Ranges',
-	17: 'Group Identifier Level 1',
-	18: 'Group Identifier Level 2',
-	19: 'Service Provider Name',
-	20: 'User controlled PLMN selector with Access Technology',
-	21: 'MSISDN',
-	22: 'Image (IMG)',
-	23: 'Support of Localised Service Areas (SoLSA)',
-	24: 'Enhanced Multi-Level Precedence and Pre-emption Service',
-	25: 'Automatic Answer for eMLPP',
-	26: 'RFU',
-	27: 'GSM Access',
-	28: 'Data download via SMS-PP',
-	29: 'Data download via SMS-CB',
-	30: 'Call Control by USIM',
-	31: 'MO-SMS Control by USIM',
-	32: 'RUN AT COMMAND command',
-	33: 'shall be set to 1',
-	34: 'Enabled Services Table',
-	35: 'APN Control List (ACL)',
-	36: 'Depersonalisation Control Keys',
-	37: 'Co-operative Network List',
-	38: 'GSM security context',
-	39: 'CPBCCH Information',
-	40: 'Investigation Scan',
-	41: 'MexE',
-	42: 'Operator controlled PLMN selector with Access Technology',
-	43: 'HPLMN selector with Access Technology',
-	44: 'Extension 5',
-	45: 'PLMN Network Name',
-	46: 'Operator PLMN List',
-	47: 'Mailbox Dialling Numbers',
-	48: 'Message Waiting Indication Status',
-	49: 'Call Forwarding Indication Status',
-	50: 'Reserved and shall be ignored',
-	51: 'Service Provider Display Information',
-	52: 'Multimedia Messaging Service (MMS)',
-	53: 'Extension 8',
-	54: 'Call control on GPRS by USIM',
-	55: 'MMS User Connectivity Parameters',
-	56: 'Network\'s indication of alerting in the MS (NIA)',
-	57: 'VGCS Group Identifier List (EFVGCS and EFVGCSS)',
-	58: 'VBS Group Identifier List (EFVBS and EFVBSS)',
-	59: 'Pseudonym',
-	60: 'User Controlled PLMN selector for I-WLAN access',
-	61: 'Operator Controlled PLMN selector for I-WLAN access',
-	62: 'User controlled WSID list',
-	63: 'Operator controlled WSID list',
-	64: 'VGCS security',
-	65: 'VBS security',
-	66: 'WLAN Reauthentication Identity',
-	67: 'Multimedia Messages Storage',
-	68: 'Generic Bootstrapping Architecture (GBA)',
-	69: 'MBMS security',
-	70: 'Data download via USSD and USSD application mode',
-	71: 'Equivalent HPLMN',
-	72: 'Additional TERMINAL PROFILE after UICC activation',
-	73: 'Equivalent HPLMN Presentation Indication',
-	74: 'Last RPLMN Selection Indication',
-	75: 'OMA BCAST Smart Card Profile',
-	76: 'GBA-based Local Key Establishment Mechanism',
-	77: 'Terminal Applications',
-	78: 'Service Provider Name Icon',
-	79: 'PLMN Network Name Icon',
-	80: 'Connectivity Parameters for USIM IP connections',
-	81: 'Home I-WLAN Specific Identifier List',
-	82: 'I-WLAN Equivalent HPLMN Presentation Indication',
-	83: 'I-WLAN HPLMN Priority Indication',
-	84: 'I-WLAN Last Registered PLMN',
-	85: 'EPS Mobility Management Information',
-	86: 'Allowed CSG Lists and corresponding indications',
-	87: 'Call control on EPS PDN connection by USIM',
-	88: 'HPLMN Direct Access',
-	89: 'eCall Data',
-	90: 'Operator CSG Lists and corresponding indications',
-	91: 'Support for SM-over-IP',
-	92: 'Support of CSG Display Control',
-	93: 'Communication Control for IMS by USIM',
-	94: 'Extended Terminal Applications',
-	95: 'Support of UICC access to IMS',
-	96: 'Non-Access Stratum configuration by USIM',
-	97: 'PWS configuration by USIM',
-	98: 'RFU',
-	99: 'URI support by UICC',
-	100: 'Extended EARFCN support',
-	101: 'ProSe',
-	102: 'USAT Application Pairing',
-	103: 'Media Type support',
-	104: 'IMS call disconnection cause',
-	105: 'URI support for MO SHORT MESSAGE CONTROL',
-	106: 'ePDG configuration Information support',
-	107: 'ePDG configuration Information configured',
-	108: 'ACDC support',
-	109: 'MCPTT',
-	110: 'ePDG configuration Information for Emergency Service support',
-	111: 'ePDG configuration Information for Emergency Service configured',
-	112: 'eCall Data over IMS',
-	113: 'URI support for SMS-PP DOWNLOAD as defined in 3GPP TS 31.111 [12]',
-	114: 'From Preferred',
-	115: 'IMS configuration data',
-	116: 'TV configuration',
-	117: '3GPP PS Data Off',
-	118: '3GPP PS Data Off Service List',
-	119: 'V2X',
-	120: 'XCAP Configuration Data',
-	121: 'EARFCN list for MTC/NB-IOT UEs',
-	122: '5GS Mobility Management Information',
-	123: '5G Security Parameters',
-	124: 'Subscription identifier privacy support',
-	125: 'SUCI calculation by the USIM',
-	126: 'UAC Access Identities support',
-	127: 'Expect control plane-based Steering of Roaming information during initial registration in VPLMN',
-	128: 'Call control on PDU Session by USIM',
-}
+EF_UST_map = ServiceNameMap(EF_UST_names)
 
 LOCI_STATUS_map = {
 	0:	'updated',
@@ -22,34 +22,40 @@ Various constants from ETSI TS 131 103 V14.2.0
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 #
 
+import sys
+
 from pySim.filesystem import *
 from pySim.utils import *
 from pySim.ts_51_011 import EF_AD
 import pySim.ts_102_221
 
+# ISIM Service descriptions, indexed by (Service Number - 1)
+# (interned, as several of them are shared with EF.UST)
+EF_IST_names = tuple(map(sys.intern, (
+	'P-CSCF address',	# 1
+	'Generic Bootstrapping Architecture (GBA)',	# 2
+	'HTTP Digest',	# 3
+	'GBA-based Local Key Establishment Mechanism',	# 4
+	'Support of P-CSCF discovery for IMS Local Break Out',	# 5
+	'Short Message Storage (SMS)',	# 6
+	'Short Message Status Reports (SMSR)',	# 7
+	'Support for SM-over-IP including data download via SMS-PP as defined in TS 31.111 [31]',	# 8
+	'Communication Control for IMS by ISIM',	# 9
+	'Support of UICC access to IMS',	# 10
+	'URI support by UICC',	# 11
+	'Media Type support',	# 12
+	'IMS call disconnection cause',	# 13
+	'URI support for MO SHORT MESSAGE CONTROL',	# 14
+	'MCPTT',	# 15
+	'URI support for SMS-PP DOWNLOAD as defined in 3GPP TS 31.111 [31]',	# 16
+	'From Preferred',	# 17
+	'IMS configuration data',	# 18
+	'XCAP Configuration Data',	# 19
+	'WebRTC URI',	# 20
+)))
+
 # Mapping between ISIM Service Number and its description
-EF_IST_map = {
-	1: 'P-CSCF address',
-	2: 'Generic Bootstrapping Architecture (GBA)',
-	3: 'HTTP Digest',
-	4: 'GBA-based Local Key Establishment Mechanism',
-	5: 'Support of P-CSCF discovery for IMS Local Break Out',
-	6: 'Short Message Storage (SMS)',
-	7: 'Short Message Status Reports (SMSR)',
-	8: 'Support for SM-over-IP including data download via SMS-PP as defined in TS 31.111 [31]',
-	9: 'Communication Control for IMS by ISIM',
-	10: 'Support of UICC access to IMS',
-	11: 'URI support by UICC',
-	12: 'Media Type support',
-	13: 'IMS call disconnection cause',
-	14: 'URI support for MO SHORT MESSAGE CONTROL',
-	15: 'MCPTT',
-	16: 'URI support for SMS-PP DOWNLOAD as defined in 3GPP TS 31.111 [31]',
-	17: 'From Preferred',
-	18: 'IMS configuration data',
-	19: 'XCAP Configuration Data',
-	20: 'WebRTC URI',
-}
+EF_IST_map = ServiceNameMap(EF_IST_names)
 
 EF_ISIM_ADF_map = {
 	'IST': '6F07',
@@ -20,6 +20,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 #
 
+from collections.abc import Mapping
 
 def h2b(s):
 	"""convert from a string of hex nibbles to a sequence of bytes"""
@@ -389,6 +390,23 @@ def enc_msisdn(msisdn, npi=0x01, ton=0x03):
 
 	return ('%02x' % bcd_len) + ('%02x' % npi_ton) + bcd
 
+class ServiceNameMap(Mapping):
+	"""Read-only {service_number: description} view on a tuple of service
+	descriptions.  Service numbers start at 1."""
+	def __init__(self, names):
+		self._names = names
+
+	def __getitem__(self, srv):
+		if not isinstance(srv, int) or srv < 1 or srv > len(self._names):
+			raise KeyError(srv)
+		return self._names[srv - 1]
+
+	def __iter__(self):
+		return iter(range(1, len(self._names) + 1))
+
+	def __len__(self):
+		return len(self._names)
+
 def dec_st(st, table="sim"):
 	"""
 	Parses the EF S/U/IST and prints the list of available services in EF S/U/IST
@@ -81,5 +81,15 @@ class DecTestCase(unittest.TestCase):
 		expected += "\tffffff0000 # unused\n"
 		self.assertEqual(utils.format_xplmn_w_act(input_str), expected)
 
+	def testServiceNameMap(self):
+		m = utils.ServiceNameMap(('foo', 'bar', 'baz'))
+		self.assertEqual(len(m), 3)
+		self.assertEqual(m[1], 'foo')
+		self.assertEqual(m[3], 'baz')
+		self.assertEqual(list(m), [1, 2, 3])
+		self.assertNotIn(0, m)
+		self.assertNotIn(4, m)
+		self.assertEqual(m.get(4), None)
+
 if __name__ == "__main__":
 	unittest.main()